@@ -0,0 +1,106 @@
+"""Shared test fixtures."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+if TYPE_CHECKING:
+    from nanobot.agent.loop import AgentLoop
+
+
+class _RecChat:
+    """Stand-in for provider.chat that replays queued responses and keeps the last messages."""
+
+    def __init__(self):
+        self.responses: list = []
+        self.last_messages: list[dict] = []
+
+    async def __call__(self, *args, **kwargs):
+        from nanobot.providers.base import LLMResponse
+
+        self.last_messages = kwargs["messages"] if "messages" in kwargs else args[0]
+        if self.responses:
+            return self.responses.pop(0)
+        return LLMResponse(content="", tool_calls=[])
+
+
+def _make_loop(workspace: Path) -> AgentLoop:
+    # Imported here so test modules that never build an AgentLoop don't pay for litellm.
+    from nanobot.agent.loop import AgentLoop
+    from nanobot.bus.queue import MessageBus
+
+    bus = MessageBus()
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    loop = AgentLoop(bus=bus, provider=provider, workspace=workspace, model="test-model", memory_window=10)
+    loop.tools.get_definitions = MagicMock(return_value=[])
+    return loop
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def _anyio_runner(anyio_backend: str):
+    """Hold anyio's test runner open so every async test shares one event loop."""
+    yield
+
+
+@pytest.fixture(scope="session")
+def ws(tmp_path_factory) -> Path:
+    """Workspace directory shared by tests that do not depend on its contents."""
+    return tmp_path_factory.mktemp("agentloop")
+
+
+@pytest.fixture(scope="session")
+def agent_loop(ws: Path) -> AgentLoop:
+    """AgentLoop built once per session; use ``loop`` to get a reset instance."""
+    return _make_loop(ws)
+
+
+def _reset_loop(loop: AgentLoop) -> AgentLoop:
+    """Put the shared AgentLoop back into the state a freshly built one would have."""
+    loop.provider.reset_mock()
+    loop.provider.chat = _RecChat()
+
+    loop.sessions._cache.clear()
+    for path in loop.sessions.sessions_dir.glob("*.jsonl"):
+        path.unlink()
+    memory_dir = loop.workspace / "memory"
+    if memory_dir.exists():
+        for path in memory_dir.iterdir():
+            path.unlink()
+
+    for task in loop._consolidation_tasks:
+        task.cancel()
+    loop._consolidation_tasks.clear()
+    loop._consolidating.clear()
+    loop._consolidation_locks.clear()
+    loop._active_tasks.clear()
+    for queue in (loop.bus.inbound, loop.bus.outbound):
+        while not queue.empty():
+            queue.get_nowait()
+
+    loop._set_tool_context("", "")
+    if mt := loop.tools.get("message"):
+        mt.set_send_callback(loop.bus.publish_outbound)
+        mt.start_turn()
+    return loop
+
+
+@pytest.fixture
+def loop(agent_loop: AgentLoop) -> AgentLoop:
+    """The shared AgentLoop, reset to a freshly built state for this test."""
+    return _reset_loop(agent_loop)
+
+
+@pytest.fixture(scope="class")
+def class_loop(agent_loop: AgentLoop) -> AgentLoop:
+    """Like ``loop``, but reset once for a whole class that shares one run."""
+    return _reset_loop(agent_loop)
@@ -1,5 +1,5 @@
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from prompt_toolkit.formatted_text import HTML
@@ -8,16 +8,15 @@ from nanobot.cli import commands
 
 
 @pytest.fixture
-def mock_prompt_session():
+def mock_prompt_session(monkeypatch):
     """Mock the global prompt session."""
     mock_session = MagicMock()
     mock_session.prompt_async = AsyncMock()
-    with patch("nanobot.cli.commands._PROMPT_SESSION", mock_session), \
-         patch("nanobot.cli.commands.patch_stdout"):
-        yield mock_session
+    monkeypatch.setattr("nanobot.cli.commands._PROMPT_SESSION", mock_session)
+    monkeypatch.setattr("nanobot.cli.commands.patch_stdout", MagicMock())
+    return mock_session
 
 
-@pytest.mark.asyncio
 async def test_read_interactive_input_async_returns_input(mock_prompt_session):
     """Test that _read_interactive_input_async returns the user input from prompt_session."""
     mock_prompt_session.prompt_async.return_value = "hello world"
@@ -30,7 +29,6 @@ async def test_read_interactive_input_async_returns_input(mock_prompt_session):
     assert isinstance(args[0], HTML)  # Verify HTML prompt is used
 
 
-@pytest.mark.asyncio
 async def test_read_interactive_input_async_handles_eof(mock_prompt_session):
     """Test that EOFError converts to KeyboardInterrupt."""
     mock_prompt_session.prompt_async.side_effect = EOFError()
@@ -39,21 +37,18 @@ async def test_read_interactive_input_async_handles_eof(mock_prompt_session):
         await commands._read_interactive_input_async()
 
 
-def test_init_prompt_session_creates_session():
+def test_init_prompt_session_creates_session(monkeypatch):
     """Test that _init_prompt_session initializes the global session."""
-    # Ensure global is None before test
-    commands._PROMPT_SESSION = None
-    
-    with patch("nanobot.cli.commands.PromptSession") as MockSession, \
-         patch("nanobot.cli.commands.FileHistory") as MockHistory, \
-         patch("pathlib.Path.home") as mock_home:
-        
-        mock_home.return_value = MagicMock()
-        
-        commands._init_prompt_session()
-        
-        assert commands._PROMPT_SESSION is not None
-        MockSession.assert_called_once()
-        _, kwargs = MockSession.call_args
-        assert kwargs["multiline"] is False
-        assert kwargs["enable_open_in_editor"] is False
+    mock_session_cls = MagicMock()
+    monkeypatch.setattr("nanobot.cli.commands._PROMPT_SESSION", None)
+    monkeypatch.setattr("nanobot.cli.commands.PromptSession", mock_session_cls)
+    monkeypatch.setattr("nanobot.cli.commands.FileHistory", MagicMock())
+    monkeypatch.setattr("pathlib.Path.home", lambda: MagicMock())
+
+    commands._init_prompt_session()
+
+    assert commands._PROMPT_SESSION is not None
+    mock_session_cls.assert_called_once()
+    _, kwargs = mock_session_cls.call_args
+    assert kwargs["multiline"] is False
+    assert kwargs["enable_open_in_editor"] is False
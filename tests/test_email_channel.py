@@ -94,7 +94,6 @@ def test_extract_text_body_falls_back_to_html() -> None:
     assert "world" in text
 
 
-@pytest.mark.asyncio
 async def test_start_returns_immediately_without_consent(monkeypatch) -> None:
     cfg = _make_config()
     cfg.consent_granted = False
@@ -112,7 +111,6 @@ async def test_start_returns_immediately_without_consent(monkeypatch) -> None:
     assert called["fetch"] is False
 
 
-@pytest.mark.asyncio
 async def test_send_uses_smtp_and_reply_subject(monkeypatch) -> None:
     class FakeSMTP:
         def __init__(self, _host: str, _port: int, timeout: int = 30) -> None:
@@ -168,7 +166,6 @@ async def test_send_uses_smtp_and_reply_subject(monkeypatch) -> None:
     assert sent["In-Reply-To"] == "<m1@example.com>"
 
 
-@pytest.mark.asyncio
 async def test_send_skips_reply_when_auto_reply_disabled(monkeypatch) -> None:
     """When auto_reply_enabled=False, replies should be skipped but proactive sends allowed."""
     class FakeSMTP:
@@ -229,7 +226,6 @@ async def test_send_skips_reply_when_auto_reply_disabled(monkeypatch) -> None:
     assert len(fake_instances[0].sent_messages) == 1
 
 
-@pytest.mark.asyncio
 async def test_send_proactive_email_when_auto_reply_disabled(monkeypatch) -> None:
     """Proactive emails (not replies) should be sent even when auto_reply_enabled=False."""
     class FakeSMTP:
@@ -279,42 +275,29 @@ async def test_send_proactive_email_when_auto_reply_disabled(monkeypatch) -> Non
     assert sent["To"] == "bob@example.com"
 
 
-@pytest.mark.asyncio
-async def test_send_skips_when_consent_not_granted(monkeypatch) -> None:
-    class FakeSMTP:
-        def __init__(self, _host: str, _port: int, timeout: int = 30) -> None:
-            self.sent_messages: list[EmailMessage] = []
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-        def starttls(self, context=None):
-            return None
-
-        def login(self, _user: str, _pw: str):
-            return None
-
-        def send_message(self, msg: EmailMessage):
-            self.sent_messages.append(msg)
-
+@pytest.mark.parametrize(
+    ("overrides", "chat_id"),
+    [
+        ({"consent_granted": False}, "alice@example.com"),
+        ({"smtp_host": ""}, "alice@example.com"),
+        ({}, ""),
+        ({}, "   "),
+    ],
+)
+async def test_send_skips_without_consent_host_or_recipient(monkeypatch, overrides, chat_id) -> None:
     called = {"smtp": False}
 
     def _smtp_factory(host: str, port: int, timeout: int = 30):
         called["smtp"] = True
-        return FakeSMTP(host, port, timeout=timeout)
 
     monkeypatch.setattr("nanobot.channels.email.smtplib.SMTP", _smtp_factory)
 
-    cfg = _make_config()
-    cfg.consent_granted = False
+    cfg = _make_config().model_copy(update=overrides)
     channel = EmailChannel(cfg, MessageBus())
     await channel.send(
         OutboundMessage(
             channel="email",
-            chat_id="alice@example.com",
+            chat_id=chat_id,
             content="Should not send.",
             metadata={"force_send": True},
         )
@@ -1,7 +1,5 @@
 import asyncio
 
-import pytest
-
 from nanobot.heartbeat.service import HeartbeatService
 from nanobot.providers.base import LLMResponse, ToolCallRequest
 
@@ -16,7 +14,6 @@ class DummyProvider:
         return LLMResponse(content="", tool_calls=[])
 
 
-@pytest.mark.asyncio
 async def test_start_is_idempotent(tmp_path) -> None:
     provider = DummyProvider([])
 
@@ -38,7 +35,6 @@ async def test_start_is_idempotent(tmp_path) -> None:
     await asyncio.sleep(0)
 
 
-@pytest.mark.asyncio
 async def test_decide_returns_skip_when_no_tool_call(tmp_path) -> None:
     provider = DummyProvider([LLMResponse(content="no tool call", tool_calls=[])])
     service = HeartbeatService(
@@ -52,7 +48,6 @@ async def test_decide_returns_skip_when_no_tool_call(tmp_path) -> None:
     assert tasks == ""
 
 
-@pytest.mark.asyncio
 async def test_trigger_now_executes_when_decision_is_run(tmp_path) -> None:
     (tmp_path / "HEARTBEAT.md").write_text("- [ ] do thing", encoding="utf-8")
 
@@ -87,7 +82,6 @@ async def test_trigger_now_executes_when_decision_is_run(tmp_path) -> None:
     assert called_with == ["check open tasks"]
 
 
-@pytest.mark.asyncio
 async def test_trigger_now_returns_none_when_decision_is_skip(tmp_path) -> None:
     (tmp_path / "HEARTBEAT.md").write_text("- [ ] do thing", encoding="utf-8")
 
@@ -0,0 +1,54 @@
+"""Test that runtime context reaches the LLM but stays out of session history."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from nanobot.agent.context import ContextBuilder
+from nanobot.agent.loop import AgentLoop
+from nanobot.bus.events import InboundMessage
+from nanobot.providers.base import LLMResponse
+
+_PONG = LLMResponse(content="pong", tool_calls=[])
+
+
+def _flatten(content: str | list) -> str:
+    if isinstance(content, str):
+        return content
+    return " ".join(p["text"] for p in content if isinstance(p, dict) and "text" in p)
+
+
+@pytest.fixture(scope="class")
+async def processed(class_loop: AgentLoop, anyio_backend: str) -> SimpleNamespace:
+    """Run one turn through the shared AgentLoop and collect the user texts once."""
+    class_loop.provider.chat.responses.append(_PONG)
+    msg = InboundMessage(channel="cli", sender_id="user", chat_id="runtime", content="ping")
+    await class_loop._process_message(msg)
+
+    sent = class_loop.provider.chat.last_messages
+    session = class_loop.sessions.get_or_create(msg.session_key)
+    persisted = [m["content"] for m in session.messages if m["role"] == "user"]
+    return SimpleNamespace(
+        sent_user_texts=[_flatten(m["content"]) for m in sent if m["role"] == "user"],
+        persisted_user_texts=persisted,
+        persisted_text=" ".join(_flatten(c) for c in persisted),
+    )
+
+
+class TestRuntimeContextHistory:
+    """Runtime metadata reaches the LLM but is not persisted to session history."""
+
+    def test_llm_receives_runtime_context(self, processed: SimpleNamespace) -> None:
+        assert any(
+            text.startswith(ContextBuilder._RUNTIME_CONTEXT_TAG) for text in processed.sent_user_texts
+        )
+
+    def test_runtime_context_not_persisted_in_session_history(
+        self, processed: SimpleNamespace
+    ) -> None:
+        assert ContextBuilder._RUNTIME_CONTEXT_TAG not in processed.persisted_text
+
+    def test_user_message_persisted_in_session_history(self, processed: SimpleNamespace) -> None:
+        assert processed.persisted_user_texts == ["ping"]
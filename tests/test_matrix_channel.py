@@ -168,7 +168,6 @@ def _make_config(**kwargs) -> MatrixConfig:
     )
 
 
-@pytest.mark.asyncio
 async def test_start_skips_load_store_when_device_id_missing(
     monkeypatch, tmp_path
 ) -> None:
@@ -205,7 +204,6 @@ async def test_start_skips_load_store_when_device_id_missing(
     await channel.stop()
 
 
-@pytest.mark.asyncio
 async def test_register_event_callbacks_uses_media_base_filter() -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -222,7 +220,6 @@ def test_media_event_filter_does_not_match_text_events() -> None:
     assert not issubclass(matrix_module.RoomMessageText, matrix_module.MATRIX_MEDIA_EVENT_FILTER)
 
 
-@pytest.mark.asyncio
 async def test_start_disables_e2ee_when_configured(
     monkeypatch, tmp_path
 ) -> None:
@@ -256,7 +253,6 @@ async def test_start_disables_e2ee_when_configured(
     await channel.stop()
 
 
-@pytest.mark.asyncio
 async def test_stop_stops_sync_forever_before_close(monkeypatch) -> None:
     channel = MatrixChannel(_make_config(device_id="DEVICE"), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -273,7 +269,6 @@ async def test_stop_stops_sync_forever_before_close(monkeypatch) -> None:
     assert task.cancelled is False
 
 
-@pytest.mark.asyncio
 async def test_room_invite_joins_when_allow_list_is_empty() -> None:
     channel = MatrixChannel(_make_config(allow_from=[]), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -287,7 +282,6 @@ async def test_room_invite_joins_when_allow_list_is_empty() -> None:
     assert client.join_calls == ["!room:matrix.org"]
 
 
-@pytest.mark.asyncio
 async def test_room_invite_respects_allow_list_when_configured() -> None:
     channel = MatrixChannel(_make_config(allow_from=["@bob:matrix.org"]), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -301,7 +295,6 @@ async def test_room_invite_respects_allow_list_when_configured() -> None:
     assert client.join_calls == []
 
 
-@pytest.mark.asyncio
 async def test_on_message_sets_typing_for_allowed_sender() -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -325,7 +318,6 @@ async def test_on_message_sets_typing_for_allowed_sender() -> None:
     ]
 
 
-@pytest.mark.asyncio
 async def test_typing_keepalive_refreshes_periodically(monkeypatch) -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -343,7 +335,6 @@ async def test_typing_keepalive_refreshes_periodically(monkeypatch) -> None:
     assert client.typing_calls[-1] == ("!room:matrix.org", False, TYPING_NOTICE_TIMEOUT_MS)
 
 
-@pytest.mark.asyncio
 async def test_on_message_skips_typing_for_self_message() -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -357,7 +348,6 @@ async def test_on_message_skips_typing_for_self_message() -> None:
     assert client.typing_calls == []
 
 
-@pytest.mark.asyncio
 async def test_on_message_skips_typing_for_denied_sender() -> None:
     channel = MatrixChannel(_make_config(allow_from=["@bob:matrix.org"]), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -379,7 +369,6 @@ async def test_on_message_skips_typing_for_denied_sender() -> None:
     assert client.typing_calls == []
 
 
-@pytest.mark.asyncio
 async def test_on_message_mention_policy_requires_mx_mentions() -> None:
     channel = MatrixChannel(_make_config(group_policy="mention"), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -401,7 +390,6 @@ async def test_on_message_mention_policy_requires_mx_mentions() -> None:
     assert client.typing_calls == []
 
 
-@pytest.mark.asyncio
 async def test_on_message_mention_policy_accepts_bot_user_mentions() -> None:
     channel = MatrixChannel(_make_config(group_policy="mention"), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -427,7 +415,6 @@ async def test_on_message_mention_policy_accepts_bot_user_mentions() -> None:
     assert client.typing_calls == [("!room:matrix.org", True, TYPING_NOTICE_TIMEOUT_MS)]
 
 
-@pytest.mark.asyncio
 async def test_on_message_mention_policy_allows_direct_room_without_mentions() -> None:
     channel = MatrixChannel(_make_config(group_policy="mention"), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -449,7 +436,6 @@ async def test_on_message_mention_policy_allows_direct_room_without_mentions() -
     assert client.typing_calls == [("!dm:matrix.org", True, TYPING_NOTICE_TIMEOUT_MS)]
 
 
-@pytest.mark.asyncio
 async def test_on_message_allowlist_policy_requires_room_id() -> None:
     channel = MatrixChannel(
         _make_config(group_policy="allowlist", group_allow_from=["!allowed:matrix.org"]),
@@ -480,7 +466,6 @@ async def test_on_message_allowlist_policy_requires_room_id() -> None:
     assert client.typing_calls == [("!allowed:matrix.org", True, TYPING_NOTICE_TIMEOUT_MS)]
 
 
-@pytest.mark.asyncio
 async def test_on_message_room_mention_requires_opt_in() -> None:
     channel = MatrixChannel(_make_config(group_policy="mention"), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -510,7 +495,6 @@ async def test_on_message_room_mention_requires_opt_in() -> None:
     assert client.typing_calls == [("!room:matrix.org", True, TYPING_NOTICE_TIMEOUT_MS)]
 
 
-@pytest.mark.asyncio
 async def test_on_message_sets_thread_metadata_when_threaded_event() -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -547,7 +531,6 @@ async def test_on_message_sets_thread_metadata_when_threaded_event() -> None:
     assert metadata["event_id"] == "$reply1"
 
 
-@pytest.mark.asyncio
 async def test_on_media_message_downloads_attachment_and_sets_metadata(
     monkeypatch, tmp_path
 ) -> None:
@@ -600,7 +583,6 @@ async def test_on_media_message_downloads_attachment_and_sets_metadata(
     assert "[attachment: " in handled[0]["content"]
 
 
-@pytest.mark.asyncio
 async def test_on_media_message_sets_thread_metadata_when_threaded_event(
     monkeypatch, tmp_path
 ) -> None:
@@ -645,7 +627,6 @@ async def test_on_media_message_sets_thread_metadata_when_threaded_event(
     assert metadata["event_id"] == "$event1"
 
 
-@pytest.mark.asyncio
 async def test_on_media_message_respects_declared_size_limit(
     monkeypatch, tmp_path
 ) -> None:
@@ -680,7 +661,6 @@ async def test_on_media_message_respects_declared_size_limit(
     assert "[attachment: large.bin - too large]" in handled[0]["content"]
 
 
-@pytest.mark.asyncio
 async def test_on_media_message_uses_server_limit_when_smaller_than_local_limit(
     monkeypatch, tmp_path
 ) -> None:
@@ -716,7 +696,6 @@ async def test_on_media_message_uses_server_limit_when_smaller_than_local_limit(
     assert "[attachment: large.bin - too large]" in handled[0]["content"]
 
 
-@pytest.mark.asyncio
 async def test_on_media_message_handles_download_error(monkeypatch, tmp_path) -> None:
     monkeypatch.setattr("nanobot.channels.matrix.get_data_dir", lambda: tmp_path)
 
@@ -750,7 +729,6 @@ async def test_on_media_message_handles_download_error(monkeypatch, tmp_path) ->
     assert "[attachment: photo.png - download failed]" in handled[0]["content"]
 
 
-@pytest.mark.asyncio
 async def test_on_media_message_decrypts_encrypted_media(monkeypatch, tmp_path) -> None:
     monkeypatch.setattr("nanobot.channels.matrix.get_data_dir", lambda: tmp_path)
     monkeypatch.setattr(
@@ -793,7 +771,6 @@ async def test_on_media_message_decrypts_encrypted_media(monkeypatch, tmp_path)
     assert attachment["size_bytes"] == 5
 
 
-@pytest.mark.asyncio
 async def test_on_media_message_handles_decrypt_error(monkeypatch, tmp_path) -> None:
     monkeypatch.setattr("nanobot.channels.matrix.get_data_dir", lambda: tmp_path)
 
@@ -834,7 +811,6 @@ async def test_on_media_message_handles_decrypt_error(monkeypatch, tmp_path) ->
     assert "[attachment: secret.txt - download failed]" in handled[0]["content"]
 
 
-@pytest.mark.asyncio
 async def test_send_clears_typing_after_send() -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -854,7 +830,6 @@ async def test_send_clears_typing_after_send() -> None:
     assert client.typing_calls[-1] == ("!room:matrix.org", False, TYPING_NOTICE_TIMEOUT_MS)
 
 
-@pytest.mark.asyncio
 async def test_send_uploads_media_and_sends_file_event(tmp_path) -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -883,7 +858,6 @@ async def test_send_uploads_media_and_sends_file_event(tmp_path) -> None:
     assert client.room_send_calls[1]["content"]["body"] == "Please review."
 
 
-@pytest.mark.asyncio
 async def test_send_adds_thread_relates_to_for_thread_metadata() -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -911,7 +885,6 @@ async def test_send_adds_thread_relates_to_for_thread_metadata() -> None:
     }
 
 
-@pytest.mark.asyncio
 async def test_send_uses_encrypted_media_payload_in_encrypted_room(tmp_path) -> None:
     channel = MatrixChannel(_make_config(e2ee_enabled=True), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -941,7 +914,6 @@ async def test_send_uses_encrypted_media_payload_in_encrypted_room(tmp_path) ->
     assert content["file"]["hashes"]["sha256"] == "hash"
 
 
-@pytest.mark.asyncio
 async def test_send_does_not_parse_attachment_marker_without_media(tmp_path) -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -961,7 +933,6 @@ async def test_send_does_not_parse_attachment_marker_without_media(tmp_path) ->
     assert client.room_send_calls[0]["content"]["body"] == f"[attachment: {missing_path}]"
 
 
-@pytest.mark.asyncio
 async def test_send_passes_thread_relates_to_to_attachment_upload(monkeypatch) -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -1005,7 +976,6 @@ async def test_send_passes_thread_relates_to_to_attachment_upload(monkeypatch) -
     }
 
 
-@pytest.mark.asyncio
 async def test_send_workspace_restriction_blocks_external_attachment(tmp_path) -> None:
     workspace = tmp_path / "workspace"
     workspace.mkdir()
@@ -1035,7 +1005,6 @@ async def test_send_workspace_restriction_blocks_external_attachment(tmp_path) -
     assert client.room_send_calls[0]["content"]["body"] == "[attachment: external.txt - upload failed]"
 
 
-@pytest.mark.asyncio
 async def test_send_handles_upload_exception_and_reports_failure(tmp_path) -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -1062,7 +1031,6 @@ async def test_send_handles_upload_exception_and_reports_failure(tmp_path) -> No
     )
 
 
-@pytest.mark.asyncio
 async def test_send_uses_server_upload_limit_when_smaller_than_local_limit(tmp_path) -> None:
     channel = MatrixChannel(_make_config(max_media_bytes=10), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -1086,7 +1054,6 @@ async def test_send_uses_server_upload_limit_when_smaller_than_local_limit(tmp_p
     assert client.room_send_calls[0]["content"]["body"] == "[attachment: tiny.txt - too large]"
 
 
-@pytest.mark.asyncio
 async def test_send_blocks_all_outbound_media_when_limit_is_zero(tmp_path) -> None:
     channel = MatrixChannel(_make_config(max_media_bytes=0), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -1109,7 +1076,6 @@ async def test_send_blocks_all_outbound_media_when_limit_is_zero(tmp_path) -> No
     assert client.room_send_calls[0]["content"]["body"] == "[attachment: empty.txt - too large]"
 
 
-@pytest.mark.asyncio
 async def test_send_omits_ignore_unverified_devices_when_e2ee_disabled() -> None:
     channel = MatrixChannel(_make_config(e2ee_enabled=False), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -1123,7 +1089,6 @@ async def test_send_omits_ignore_unverified_devices_when_e2ee_disabled() -> None
     assert "ignore_unverified_devices" not in client.room_send_calls[0]
 
 
-@pytest.mark.asyncio
 async def test_send_stops_typing_keepalive_task() -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -1141,7 +1106,6 @@ async def test_send_stops_typing_keepalive_task() -> None:
     assert client.typing_calls[-1] == ("!room:matrix.org", False, TYPING_NOTICE_TIMEOUT_MS)
 
 
-@pytest.mark.asyncio
 async def test_send_progress_keeps_typing_keepalive_running() -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -1164,7 +1128,6 @@ async def test_send_progress_keeps_typing_keepalive_running() -> None:
     assert client.typing_calls[-1] == ("!room:matrix.org", True, TYPING_NOTICE_TIMEOUT_MS)
 
 
-@pytest.mark.asyncio
 async def test_send_clears_typing_when_send_fails() -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -1179,7 +1142,6 @@ async def test_send_clears_typing_when_send_fails() -> None:
     assert client.typing_calls[-1] == ("!room:matrix.org", False, TYPING_NOTICE_TIMEOUT_MS)
 
 
-@pytest.mark.asyncio
 async def test_send_adds_formatted_body_for_markdown() -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -1200,7 +1162,6 @@ async def test_send_adds_formatted_body_for_markdown() -> None:
     assert "<li>[x] done</li>" in str(content["formatted_body"])
 
 
-@pytest.mark.asyncio
 async def test_send_adds_formatted_body_for_inline_url_superscript_subscript() -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -1223,7 +1184,6 @@ async def test_send_adds_formatted_body_for_inline_url_superscript_subscript() -
     assert "<sub>2</sub>" in str(content["formatted_body"])
 
 
-@pytest.mark.asyncio
 async def test_send_sanitizes_disallowed_link_scheme() -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -1249,7 +1209,6 @@ def test_matrix_html_cleaner_strips_event_handlers_and_script_tags() -> None:
     assert '<a href="https://example.com"' in cleaned_html
 
 
-@pytest.mark.asyncio
 async def test_send_keeps_only_mxc_image_sources() -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -1265,7 +1224,6 @@ async def test_send_keeps_only_mxc_image_sources() -> None:
     assert 'src="https://example.com/a.png"' not in formatted_body
 
 
-@pytest.mark.asyncio
 async def test_send_falls_back_to_plaintext_when_markdown_render_fails(monkeypatch) -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -1284,7 +1242,6 @@ async def test_send_falls_back_to_plaintext_when_markdown_render_fails(monkeypat
     assert content == {"msgtype": "m.text", "body": markdown_text, "m.mentions": {}}
 
 
-@pytest.mark.asyncio
 async def test_send_keeps_plaintext_only_for_plain_text() -> None:
     channel = MatrixChannel(_make_config(), MessageBus())
     client = _FakeAsyncClient("", "", "", None)
@@ -1,9 +1,6 @@
-import pytest
-
 from nanobot.agent.tools.message import MessageTool
 
 
-@pytest.mark.asyncio
 async def test_message_tool_returns_error_when_no_target_context() -> None:
     tool = MessageTool()
     result = await tool.execute(content="test")
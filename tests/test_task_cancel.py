@@ -3,32 +3,25 @@
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
-
-import pytest
+from unittest.mock import AsyncMock, MagicMock
 
 
 def _make_loop():
-    """Create a minimal AgentLoop with mocked dependencies."""
+    """Create a bare AgentLoop carrying only the state /stop and dispatch use."""
     from nanobot.agent.loop import AgentLoop
     from nanobot.bus.queue import MessageBus
 
     bus = MessageBus()
-    provider = MagicMock()
-    provider.get_default_model.return_value = "test-model"
-    workspace = MagicMock()
-    workspace.__truediv__ = MagicMock(return_value=MagicMock())
-
-    with patch("nanobot.agent.loop.ContextBuilder"), \
-         patch("nanobot.agent.loop.SessionManager"), \
-         patch("nanobot.agent.loop.SubagentManager") as MockSubMgr:
-        MockSubMgr.return_value.cancel_by_session = AsyncMock(return_value=0)
-        loop = AgentLoop(bus=bus, provider=provider, workspace=workspace)
+    loop = AgentLoop.__new__(AgentLoop)
+    loop.bus = bus
+    loop.subagents = MagicMock()
+    loop.subagents.cancel_by_session = AsyncMock(return_value=0)
+    loop._active_tasks = {}
+    loop._processing_lock = asyncio.Lock()
     return loop, bus
 
 
 class TestHandleStop:
-    @pytest.mark.asyncio
     async def test_stop_no_active_task(self):
         from nanobot.bus.events import InboundMessage
 
@@ -38,7 +31,6 @@ class TestHandleStop:
         out = await asyncio.wait_for(bus.consume_outbound(), timeout=1.0)
         assert "No active task" in out.content
 
-    @pytest.mark.asyncio
     async def test_stop_cancels_active_task(self):
         from nanobot.bus.events import InboundMessage
 
@@ -63,7 +55,6 @@ class TestHandleStop:
         out = await asyncio.wait_for(bus.consume_outbound(), timeout=1.0)
         assert "stopped" in out.content.lower()
 
-    @pytest.mark.asyncio
     async def test_stop_cancels_multiple_tasks(self):
         from nanobot.bus.events import InboundMessage
 
@@ -90,7 +81,6 @@ class TestHandleStop:
 
 
 class TestDispatch:
-    @pytest.mark.asyncio
     async def test_dispatch_processes_and_publishes(self):
         from nanobot.bus.events import InboundMessage, OutboundMessage
 
@@ -103,7 +93,6 @@ class TestDispatch:
         out = await asyncio.wait_for(bus.consume_outbound(), timeout=1.0)
         assert out.content == "hi"
 
-    @pytest.mark.asyncio
     async def test_processing_lock_serializes(self):
         from nanobot.bus.events import InboundMessage, OutboundMessage
 
@@ -127,7 +116,6 @@ class TestDispatch:
 
 
 class TestSubagentCancellation:
-    @pytest.mark.asyncio
     async def test_cancel_by_session(self):
         from nanobot.agent.subagent import SubagentManager
         from nanobot.bus.queue import MessageBus
@@ -155,7 +143,6 @@ class TestSubagentCancellation:
         assert count == 1
         assert cancelled.is_set()
 
-    @pytest.mark.asyncio
     async def test_cancel_by_session_no_tasks(self):
         from nanobot.agent.subagent import SubagentManager
         from nanobot.bus.queue import MessageBus